@@ -0,0 +1,46 @@
+# meridian-runtime/benchmarks/_common.py
+#
+# Helpers shared by the benchmark scripts. The scripts run as plain files, so this
+# module is imported from the script directory rather than as part of a package.
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any
+
+
+def dumps_doc(doc: dict[str, Any], *, pretty: bool = True) -> str:
+    """
+    Serialize a benchmark document with the stdlib encoder; pretty output is sorted and
+    2-space indented. Non-finite KPIs stay visible as NaN/Infinity rather than null.
+    """
+    if pretty:
+        return json.dumps(doc, indent=2, sort_keys=True)
+    return json.dumps(doc)
+
+
+def _bench_cpu() -> str:
+    return os.getenv("MERIDIAN_BENCH_CPU", "").strip()
+
+
+def pin_cpu() -> None:
+    """
+    Pin the process to the CPU named by MERIDIAN_BENCH_CPU where os.sched_setaffinity
+    exists. Pinning is opt-in: with the variable unset the affinity is left alone.
+    """
+    raw = _bench_cpu()
+    if not raw or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {int(raw)})
+    except (ValueError, OSError) as e:
+        print(f"MERIDIAN_BENCH_CPU={raw!r}: could not pin process ({e})", file=sys.stderr)
+
+
+def cpu_env() -> dict[str, list[int]]:
+    """Affinity entry for a document's "env" block; empty unless MERIDIAN_BENCH_CPU is set."""
+    if not _bench_cpu() or not hasattr(os, "sched_getaffinity"):
+        return {}
+    return {"cpu": sorted(os.sched_getaffinity(0))}
@@ -16,24 +16,34 @@
 #   # Write JSON to file
 #   MERIDIAN_EXPORT_JSON=1 uv run python benchmarks/bench_edge.py > /dev/null
 #
+#   # Pin to one CPU (Linux) to reduce migration noise; unset leaves affinity alone
+#   MERIDIAN_BENCH_CPU=2 uv run python benchmarks/bench_edge.py
+#
 # Notes:
 #   - The script emits a single JSON document to stdout unless MERIDIAN_EXPORT_JSON=1,
 #     in which case it also writes to benchmarks/current.edge.json.
 #   - It supports toggling metrics via MERIDIAN_METRICS=on to measure overhead.
 #   - It runs two sub-benches by default: "no_metrics" and "prom_metrics" (unless the
 #     environment forces one mode explicitly).
+#   - With MERIDIAN_BENCH_CPU set (platforms with os.sched_setaffinity) the process is
+#     pinned to that CPU and "env.cpu" records the resulting affinity set.
 #
 from __future__ import annotations
 
+import array
+import gc
 import json
 import os
-import statistics
 import sys
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+from _common import cpu_env, dumps_doc, pin_cpu
+
 try:
     from meridian.core import Edge
     from meridian.core.policies import Latest
@@ -93,34 +103,38 @@ def _ensure_metrics(mode: str) -> str:
     return "off"
 
 
-def _time_now_ns() -> int:
-    return time.perf_counter_ns()
-
-
-def _run_put_get_once(n_items: int, batch: int, capacity: int) -> tuple[float, int]:
+def _run_put_get_once(edge: Edge[int], n_items: int, batch: int) -> tuple[float, int]:
     """
-    Execute n_items put operations (using Latest policy to avoid excessive growth),
-    then drain until empty. Returns (seconds, processed_count).
+    Execute n_items put operations in batches via the bulk Edge API (using Latest policy
+    to avoid excessive growth), then drain until empty. Returns (seconds, processed_count).
+    The edge is cleared first so every iteration starts empty without paying for
+    edge/port construction inside the timed region.
     """
-    edge = _mk_edge(capacity)
+    edge.clear()
     pol = Latest()
+    # Bind hot lookups to locals so the loops skip per-iteration LOAD_ATTR
+    put_many = edge.try_put_many
+    perf_counter = time.perf_counter
+
+    # Keep collector pauses out of the timed region: collect up front, then suspend GC
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter()
+        # Put phase: one bulk call per batch slice of a single iterator. Latest never
+        # blocks, so a zero return means the iterator is exhausted.
+        values = iter(range(n_items))
+        while put_many(islice(values, batch), pol):
+            pass
+
+        # Drain phase
+        processed = edge.drain_into(None)
 
-    start_ns = _time_now_ns()
-    # Put phase
-    i = 0
-    while i < n_items:
-        end = min(n_items, i + batch)
-        for v in range(i, end):
-            edge.try_put(v, pol)
-        i = end
-
-    # Drain phase
-    processed = 0
-    while edge.depth() > 0:
-        _ = edge.try_get()
-        processed += 1
-
-    dt_s = (_time_now_ns() - start_ns) / 1e9
+        dt_s = perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
     return dt_s, processed
 
 
@@ -135,18 +149,21 @@ def _run_bench_series(cfg: BenchConfig, metrics_mode: str) -> dict[str, Any]:
     Run warmups then measured iterations; return summary stats.
     """
     resolved_mode = _ensure_metrics(metrics_mode)
-    warmup_times: list[float] = []
-    measure_times: list[float] = []
-    measure_processed: list[int] = []
+    # Unboxed C double/int64 storage for per-iteration samples
+    warmup_times = array.array("d")
+    measure_times = array.array("d")
+    measure_processed = array.array("q")
+    # Build once after metrics are configured; instruments are bound at construction
+    edge = _mk_edge(cfg.capacity)
 
     # Warmups
     for _ in range(cfg.warmup_iters):
-        dt, processed = _run_put_get_once(cfg.items, cfg.batch, cfg.capacity)
+        dt, processed = _run_put_get_once(edge, cfg.items, cfg.batch)
         warmup_times.append(dt)
 
     # Measurements
     for _ in range(cfg.measure_iters):
-        dt, processed = _run_put_get_once(cfg.items, cfg.batch, cfg.capacity)
+        dt, processed = _run_put_get_once(edge, cfg.items, cfg.batch)
         measure_times.append(dt)
         measure_processed.append(processed)
 
@@ -155,8 +172,7 @@ def _run_bench_series(cfg: BenchConfig, metrics_mode: str) -> dict[str, Any]:
     total_time = sum(measure_times)
     ops_sec = _ops_per_sec(total_processed, total_time)
 
-    p50 = statistics.median(measure_times) if measure_times else float("nan")
-    p95 = _percentile(measure_times, 95.0) if measure_times else float("nan")
+    p50, p95 = _p50_p95(measure_times)
 
     return {
         "mode": "prom_metrics" if resolved_mode == "on" else "no_metrics",
@@ -174,28 +190,28 @@ def _run_bench_series(cfg: BenchConfig, metrics_mode: str) -> dict[str, Any]:
             "ops_per_sec": ops_sec,
             "time_p50_seconds": p50,
             "time_p95_seconds": p95,
-            "times_seconds": measure_times,
+            "times_seconds": measure_times.tolist(),
         },
         "env": {
             "python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
             "platform": sys.platform,
+            **cpu_env(),
         },
     }
 
 
-def _percentile(values: list[float], pct: float) -> float:
+def _p50_p95(values: Sequence[float]) -> tuple[float, float]:
     """
-    Compute percentile using nearest-rank on sorted data.
+    Compute (p50, p95) from a single sort of the data: p50 is the median and p95 uses
+    nearest-rank, matching the values recorded in baseline.json.
     """
     if not values:
-        return float("nan")
-    if pct <= 0:
-        return min(values)
-    if pct >= 100:
-        return max(values)
+        return float("nan"), float("nan")
     data = sorted(values)
-    k = int(round((pct / 100.0) * (len(data) - 1)))
-    return data[k]
+    n = len(data)
+    mid = n // 2
+    p50 = data[mid] if n % 2 else (data[mid - 1] + data[mid]) / 2
+    return p50, data[int(round(0.95 * (n - 1)))]
 
 
 def _write_current_json(doc: dict[str, Any]) -> None:
@@ -203,11 +219,12 @@ def _write_current_json(doc: dict[str, Any]) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     tmp = out_path.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
-        json.dump(doc, f, indent=2, sort_keys=True)
+        f.write(dumps_doc(doc))
     tmp.replace(out_path)
 
 
 def _main() -> int:
+    pin_cpu()
     cfg = BenchConfig()
 
     results: list[dict[str, Any]] = []
@@ -230,7 +247,7 @@ def _main() -> int:
     }
 
     # Print to stdout
-    print(json.dumps(combined, indent=2, sort_keys=True))
+    print(dumps_doc(combined))
 
     # Optionally write to file
     if cfg.export_json:
@@ -22,24 +22,45 @@
 #   # Export JSON to file as well as stdout
 #   MERIDIAN_EXPORT_JSON=1 uv run python benchmarks/bench_scheduler.py > /dev/null
 #
+#   # Re-exec under PyPy (if pypy3 is on PATH) to measure JIT'd dispatch
+#   MERIDIAN_BENCH_INTERP=pypy uv run python benchmarks/bench_scheduler.py
+#
+#   # Pin to one CPU (Linux) to reduce migration noise; unset leaves affinity alone
+#   MERIDIAN_BENCH_CPU=2 uv run python benchmarks/bench_scheduler.py
+#
 # Notes:
 #   - The Scheduler already records per-iteration latency in a histogram named
 #     "scheduler_loop_latency_seconds". This script enables PrometheusMetrics,
 #     runs the scheduler, and then summarizes the histogram including p50/p95/p99.
+#   - The "env.implementation" field records the interpreter family (CPython, PyPy, ...).
+#   - Garbage collection is suspended while the scheduler runs so collector pauses do not
+#     contaminate the latency histogram.
+#   - On POSIX the scheduler runs on the main thread and a SIGALRM interval timer ends the
+#     run ("config.driver": "sigalrm"); elsewhere it falls back to a background thread.
+#   - With MERIDIAN_BENCH_CPU set (platforms with os.sched_setaffinity) the process is
+#     pinned to that CPU and "env.cpu" records the resulting affinity set.
 #
 from __future__ import annotations
 
+import gc
 import json
 import math
 import os
+import platform
 import random
+import shutil
+import signal
 import sys
 import threading
 import time
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
+from _common import cpu_env, dumps_doc, pin_cpu
+
 # ---- Runtime imports (assumes meridian-runtime is installed / in PYTHONPATH)
 try:
     from meridian.core import Message, MessageType, Node, Scheduler, SchedulerConfig, Subgraph
@@ -79,29 +100,31 @@ def _artifact_path() -> Path:
     return path
 
 
-def _percentile_from_histogram_cumulative(
-    buckets: dict[float, int], total: int, pct: float
-) -> float:
+def _percentiles(
+    upper_bounds: list[float], cumulative: list[int], total: int, pcts: list[float]
+) -> list[float]:
     """
-    Estimate percentile from a cumulative histogram mapping (upper_bound -> cumulative count).
-    Includes +Inf as float('inf').
+    Estimate several percentiles from one cumulative histogram given as parallel lists
+    sorted by upper bound (upper_bounds[i] -> cumulative[i]). Includes +Inf as
+    float('inf'). Cumulative counts are non-decreasing, so each target bucket is found by
+    bisection over the same list.
     """
-    if total <= 0 or not buckets:
-        return float("nan")
-    if pct <= 0:
-        # First non-zero bucket upper bound
-        for ub in sorted(buckets.keys(), key=lambda x: float(x)):
-            if buckets[ub] > 0:
-                return float(ub)
-        return float("nan")
-    if pct >= 100:
-        return float("inf")
-    target = math.ceil((pct / 100.0) * total)
-    for ub in sorted(buckets.keys(), key=lambda x: float(x)):
-        if buckets[ub] >= target:
-            return float(ub)
-    # Fallback if not found
-    return float("inf")
+    if total <= 0 or not upper_bounds:
+        return [float("nan")] * len(pcts)
+    n = len(upper_bounds)
+    out: list[float] = []
+    for pct in pcts:
+        if pct <= 0:
+            # First non-zero bucket upper bound
+            idx = bisect_right(cumulative, 0)
+            out.append(float(upper_bounds[idx]) if idx < n else float("nan"))
+        elif pct >= 100:
+            out.append(float("inf"))
+        else:
+            idx = bisect_left(cumulative, math.ceil((pct / 100.0) * total))
+            # Fallback to +Inf if not found
+            out.append(float(upper_bounds[idx]) if idx < n else float("inf"))
+    return out
 
 
 def _maybe_enable_prom_metrics() -> None:
@@ -114,43 +137,62 @@ def _maybe_enable_prom_metrics() -> None:
 
 
 # ---- Minimal workload nodes
+_BURST_TABLE_SIZE = 1024  # power of two so the index wraps with a mask
+_BURST_TABLE_MASK = _BURST_TABLE_SIZE - 1
+
+
 class Producer(Node):
     """
     Producer emits increasing integers on each tick to generate message load.
     Emits Message(DATA, payload) via a declared output port, per runtime contract.
     """
 
-    def __init__(self, name: str, out_port: Port, burst_max: int = 8) -> None:
+    def __init__(self, name: str, out_port: Port, burst_max: int = 8, seed: int = 0) -> None:
         super().__init__(name)
         # Ensure Node has a matching output port name so Node.emit() can resolve it
         self.outputs = [out_port]
         self._out = out_port
         self._burst_max = max(1, burst_max)
+        self._seed = seed
         self._seq = 0
+        self._bursts: tuple[int, ...] = ()
+        self._tick = 0
+        # Resolve the output port once instead of on every emitted message
+        self._emit_out = self._bind_emit(out_port.name)
 
     def on_start(self) -> None:
         self._seq = 0
+        # Precompute a cyclic table of burst sizes so on_tick does no RNG work
+        rng = random.Random(self._seed)
+        self._bursts = tuple(rng.randint(1, self._burst_max) for _ in range(_BURST_TABLE_SIZE))
+        self._tick = 0
 
     def on_tick(self) -> None:
         # Emit a burst of messages to keep the scheduler busy
-        burst = random.randint(1, self._burst_max)
-        for _ in range(burst):
-            msg = Message(MessageType.DATA, self._seq)
-            self.emit(self._out.name, msg)
-            self._seq += 1
+        burst = self._bursts[self._tick & _BURST_TABLE_MASK]
+        self._tick += 1
+        # Bind hot lookups to locals; the burst loop runs once per emitted message
+        emit = self._emit_out
+        data = MessageType.DATA
+        seq = self._seq
+        try:
+            for _ in range(burst):
+                emit(Message(data, seq))
+                seq += 1
+        finally:
+            self._seq = seq
 
 
 class Consumer(Node):
     """
     Consumer counts messages; work is intentionally light to focus on scheduler loop behavior.
-    Declares input port so scheduler can route messages by port name.
+    Declares one input port per incoming edge so the scheduler drains every edge.
     """
 
-    def __init__(self, name: str, in_port: Port, batch_max: int = 32) -> None:
+    def __init__(self, name: str, in_ports: list[Port], batch_max: int = 32) -> None:
         super().__init__(name)
-        # Ensure Node declares the input port for routing
-        self.inputs = [in_port]
-        self._in = in_port
+        # Ensure Node declares the input ports for routing
+        self.inputs = list(in_ports)
         self._batch_max = max(1, batch_max)
         self._processed = 0
 
@@ -170,53 +212,106 @@ class Consumer(Node):
 
 
 # ---- Topology assembly
-def _mk_ports(n: int = 4) -> tuple[list[Port], list[Port]]:
-    outs: list[Port] = []
-    ins: list[Port] = []
-    for i in range(n):
-        outs.append(Port(f"o{i}", PortDirection.OUTPUT, PortSpec(f"o{i}", int)))
-        ins.append(Port(f"i{i}", PortDirection.INPUT, PortSpec(f"i{i}", int)))
-    return outs, ins
+def _edge_count(cfg: BenchSchedConfig) -> int:
+    """
+    Number of edges in the paired topology: every producer and consumer gets at least one.
+    """
+    return max(cfg.producers, cfg.consumers)
 
 
 def _mk_subgraph(cfg: BenchSchedConfig) -> tuple[Subgraph, list[Consumer]]:
-    outs, ins = _mk_ports(max(cfg.producers, cfg.consumers))
-    producers: list[Producer] = []
-    consumers: list[Consumer] = []
-
-    for p in range(cfg.producers):
-        producers.append(Producer(f"prod{p}", outs[p % len(outs)], burst_max=8))
-    for c in range(cfg.consumers):
-        consumers.append(Consumer(f"cons{c}", ins[c % len(ins)], batch_max=32))
+    """
+    Wire producers to consumers pairwise (edge k: prod[k % P] -> cons[k % C]) rather than
+    as a full P x C mesh, so edge count grows linearly with the node count. The runtime
+    plan tracks one edge per input port, so each edge gets its own consumer input port.
+    """
+    producers = [
+        Producer(
+            f"prod{p}",
+            Port(f"o{p}", PortDirection.OUTPUT, PortSpec(f"o{p}", int)),
+            burst_max=8,
+            seed=cfg.seed + p,
+        )
+        for p in range(cfg.producers)
+    ]
+    in_ports: list[list[Port]] = [[] for _ in range(cfg.consumers)]
+    wiring: list[tuple[Producer, int, Port]] = []
+    for k in range(_edge_count(cfg)):
+        port = Port(f"i{k}", PortDirection.INPUT, PortSpec(f"i{k}", int))
+        c = k % cfg.consumers
+        in_ports[c].append(port)
+        wiring.append((producers[k % cfg.producers], c, port))
+    consumers = [Consumer(f"cons{c}", in_ports[c], batch_max=32) for c in range(cfg.consumers)]
 
-    # Build subgraph with nodes and explicitly wire producer outputs to consumer inputs
     g = Subgraph.from_nodes("bench_sched_topology", [*producers, *consumers])
-    for p in producers:
-        for c in consumers:
-            g.connect((p.name, p._out.name), (c.name, c._in.name), capacity=cfg.capacity)
+    for p, c, port in wiring:
+        g.connect((p.name, p._out.name), (consumers[c].name, port.name), capacity=cfg.capacity)
     return g, consumers
 
 
 # ---- Metrics extraction
-def _get_scheduler_loop_hist() -> tuple[float, int, dict[float, int]]:
+def _get_scheduler_loop_hist() -> tuple[float, int, list[float], list[int]]:
     """
-    Returns (sum, count, buckets) for scheduler_loop_latency_seconds.
+    Returns (sum, count, upper_bounds, counts) for scheduler_loop_latency_seconds, where
+    upper_bounds is sorted (ending with +Inf) and counts holds per-bucket, non-cumulative
+    observation counts aligned with it.
     """
     metrics = get_metrics()
     if not isinstance(metrics, PrometheusMetrics):
-        return (0.0, 0, {})
-    hists = metrics.get_all_histograms()
-    for key, hist in hists.items():
-        if key.endswith("scheduler_loop_latency_seconds"):
-            return (hist.sum, hist.count, hist.buckets)
-    return (0.0, 0, {})
+        return (0.0, 0, [], [])
+    get_histogram = getattr(metrics, "get_histogram", None)
+    if get_histogram is not None:
+        hist = get_histogram("scheduler_loop_latency_seconds")
+        if hist is not None:
+            return (hist.sum, hist.count, list(hist.bounds), hist.counts)
+    # Older providers without the direct lookup, or a label-keyed histogram the direct
+    # lookup misses: scan the registry copy
+    for key, hist in metrics.get_all_histograms().items():
+        if key.partition("{")[0].endswith("scheduler_loop_latency_seconds"):
+            return (hist.sum, hist.count, list(hist.bounds), hist.counts)
+    return (0.0, 0, [], [])
 
 
 # ---- Benchmark runner
-def _run_scheduler(cfg: BenchSchedConfig) -> dict[str, Any]:
-    # Deterministic randomness for repeatability
-    random.seed(cfg.seed)
+def _drive_scheduler(sched: Scheduler, cfg: BenchSchedConfig) -> str:
+    """
+    Run the scheduler for cfg.seconds and return the driver used.
+
+    Where SIGALRM is available (POSIX, main thread) the scheduler runs on the calling thread
+    and an interval timer requests shutdown, so no second thread competes for the GIL while
+    latency is recorded. Otherwise fall back to a background thread and a sleeping caller.
+    """
+    if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+
+        def request_stop(signum: int, frame: Any) -> None:
+            # Only flip the loop flag: Scheduler.shutdown() logs, and printing from a signal
+            # handler can interrupt the main thread mid-write on the same stream
+            # ("RuntimeError: reentrant call").
+            sched._shutdown = True
+
+        previous = signal.signal(signal.SIGALRM, request_stop)
+        signal.setitimer(signal.ITIMER_REAL, cfg.seconds)
+        try:
+            sched.run()
+        finally:
+            # The scheduler may stop on its own idle timeout before the alarm fires
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        return "sigalrm"
+
+    t = threading.Thread(target=sched.run, name="bench-scheduler", daemon=True)
+    t.start()
+
+    # Let it run for configured duration
+    time.sleep(cfg.seconds)
 
+    # Request shutdown and wait
+    sched.shutdown()
+    t.join(timeout=cfg.shutdown_timeout_s + 5.0)
+    return "thread"
+
+
+def _run_scheduler(cfg: BenchSchedConfig) -> dict[str, Any]:
     # Ensure histogram is available
     _maybe_enable_prom_metrics()
 
@@ -232,36 +327,42 @@ def _run_scheduler(cfg: BenchSchedConfig) -> dict[str, Any]:
     sched = Scheduler(s_cfg)
     sched.register(g)
 
-    # Run scheduler in background
-    t = threading.Thread(target=sched.run, name="bench-scheduler", daemon=True)
-    t.start()
-
-    # Let it run for configured duration
-    time.sleep(cfg.seconds)
-
-    # Request shutdown and wait
-    sched.shutdown()
-    t.join(timeout=cfg.shutdown_timeout_s + 5.0)
+    # Run with GC suspended so collector pauses do not show up in the loop latency histogram
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        driver = _drive_scheduler(sched, cfg)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
     # Gather metrics
-    h_sum, h_count, h_buckets = _get_scheduler_loop_hist()
-    p50 = _percentile_from_histogram_cumulative(h_buckets, h_count, 50.0)
-    p95 = _percentile_from_histogram_cumulative(h_buckets, h_count, 95.0)
-    p99 = _percentile_from_histogram_cumulative(h_buckets, h_count, 99.0)
+    h_sum, h_count, h_bounds, h_counts = _get_scheduler_loop_hist()
+    # Accumulate once after shutdown and derive every percentile from the same list
+    h_cumulative = list(accumulate(h_counts))
+    p50, p95, p99 = _percentiles(h_bounds, h_cumulative, h_count, [50.0, 95.0, 99.0])
 
     total_processed = sum(c.processed for c in consumers)
 
     return {
         "name": "scheduler_loop",
-        "version": 1,
+        # Version 2: paired producer/consumer wiring replaced the full mesh; version 1
+        # baselines measure a different workload and are refused by compare_baseline.
+        "version": 2,
         "env": {
             "python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            "implementation": platform.python_implementation(),
             "platform": sys.platform,
+            **cpu_env(),
         },
         "config": {
             "seconds": cfg.seconds,
             "producers": cfg.producers,
             "consumers": cfg.consumers,
+            "topology": "paired",
+            "driver": driver,
+            "edges": _edge_count(cfg),
             "capacity": cfg.capacity,
             "tick_interval_ms": cfg.tick_interval_ms,
             "idle_sleep_ms": cfg.idle_sleep_ms,
@@ -277,7 +378,7 @@ def _run_scheduler(cfg: BenchSchedConfig) -> dict[str, Any]:
                 "p50_estimate_seconds": p50,
                 "p95_estimate_seconds": p95,
                 "p99_estimate_seconds": p99,
-                "buckets": {str(k): int(v) for k, v in h_buckets.items()},
+                "buckets": {str(k): int(v) for k, v in zip(h_bounds, h_cumulative, strict=True)},
             },
             "total_processed": int(total_processed),
             "iterations_per_second_estimate": (
@@ -296,16 +397,36 @@ def _write_current(doc: dict[str, Any]) -> None:
     out = _artifact_path()
     tmp = out.with_suffix(".tmp")
     with tmp.open("w", encoding="utf-8") as f:
-        json.dump(doc, f, indent=2, sort_keys=True)
+        f.write(dumps_doc(doc))
     tmp.replace(out)
 
 
+def _maybe_reexec_interpreter() -> None:
+    """
+    Re-exec this script under PyPy when MERIDIAN_BENCH_INTERP=pypy and pypy3 is on PATH.
+    """
+    if os.getenv("MERIDIAN_BENCH_INTERP", "").lower() != "pypy":
+        return
+    if platform.python_implementation() == "PyPy":
+        return
+    pypy = shutil.which("pypy3")
+    if pypy is None:
+        print(
+            "MERIDIAN_BENCH_INTERP=pypy requested but pypy3 not found; using current interpreter",
+            file=sys.stderr,
+        )
+        return
+    os.execv(pypy, [pypy, os.path.abspath(__file__), *sys.argv[1:]])
+
+
 def _main() -> int:
+    _maybe_reexec_interpreter()
+    pin_cpu()
     cfg = BenchSchedConfig()
     doc = _run_scheduler(cfg)
 
     # Emit to stdout
-    print(json.dumps(doc, indent=2, sort_keys=True))
+    print(dumps_doc(doc))
 
     # Optionally write to benchmarks/current.scheduler.json
     if cfg.export_json:
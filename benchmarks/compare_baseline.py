@@ -20,6 +20,8 @@ Environment variables:
   MERIDIAN_BENCH_REGRESSION_PCT   - Allowed regression percent (default: 10)
   MERIDIAN_BENCH_WARN_ONLY        - If set to "1", "true", "yes", or "on", prints warnings instead of failing
   MERIDIAN_BENCH_BASELINE_SECTION - Optional section name in baseline to compare against ("edge_put_get", "scheduler_loop", etc.)
+  MERIDIAN_BENCH_CACHE            - If truthy, cache the parsed baseline next to it as <baseline>.cache
+                                    (reused while the baseline's mtime and size are unchanged)
 
 Input expectations:
   - Baseline JSON contains named entries with numeric KPIs for each benchmark.
@@ -70,6 +72,8 @@ Comparison semantics:
       (current - baseline) / baseline * 100 <= threshold_pct
   - Unknown metrics in current that do not have entries in baseline are ignored.
   - Missing metrics in current that exist in baseline are reported as warnings.
+  - A baseline section may carry a "version"; when it differs from the current document's
+    "version" (both default to 1) the comparison is refused with exit code 1.
 
 Exit codes:
   0 - No regression beyond threshold (or warn-only mode)
@@ -81,18 +85,36 @@ from __future__ import annotations
 
 import argparse
 import json
+import marshal
 import os
 import sys
-from dataclasses import dataclass
+from collections.abc import Callable, Collection
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+from _common import dumps_doc
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # ---------------------------
 # Configuration and constants
 # ---------------------------
 
 DEFAULT_THRESHOLD_PCT = 10.0
 
+# Accepted spellings for boolean environment flags
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+# Bumped whenever the on-disk cache layout written by _load_json changes
+_CACHE_FORMAT = 1
+
+# Concrete JSON number types accepted by the generic metric fallbacks
+_NUMBER_TYPES = (int, float)
+
 # Metric direction: True => higher is better, False => lower is better
 # This mapping is used to interpret whether increases/decreases are regressions.
 METRIC_DIRECTIONS = {
@@ -108,6 +130,14 @@ METRIC_DIRECTIONS = {
     "loop_p99_ms": False,
 }
 
+# Per-direction (label, higher-is-better flag, message wording), resolved once per metric
+_HIGHER_IS_BETTER = ("higher_is_better", True, "drop")
+_LOWER_IS_BETTER = ("lower_is_better", False, "increase")
+_DIRECTION_CMP = {
+    metric: _HIGHER_IS_BETTER if higher else _LOWER_IS_BETTER
+    for metric, higher in METRIC_DIRECTIONS.items()
+}
+
 # Fallback metric key candidates for scheduler and edge when extracting from "current"
 EDGE_SUMMARY_TO_BASELINE_KEYS = {
     # current.summary.ops_per_sec.no_metrics -> baseline.ops_per_sec_no_metrics
@@ -126,6 +156,49 @@ SCHED_SUMMARY_TO_BASELINE_KEYS = {
 }
 
 
+def _make_accessor(path: tuple[str, ...]) -> Callable[[Any], Any]:
+    """
+    Build a getter for a fixed key path, unrolled for the short paths used here.
+    The getter raises KeyError/TypeError when the path does not resolve.
+    """
+    if len(path) == 1:
+        (k0,) = path
+        return lambda d: d[k0]
+    if len(path) == 2:
+        k0, k1 = path
+        return lambda d: d[k0][k1]
+    if len(path) == 3:
+        k0, k1, k2 = path
+        return lambda d: d[k0][k1][k2]
+
+    def get(d: Any) -> Any:
+        for k in path:
+            d = d[k]
+        return d
+
+    return get
+
+
+# Per-section (baseline key, accessor) pairs, built once at import
+_SECTION_ACCESSORS: dict[str, tuple[tuple[str, Callable[[Any], Any]], ...]] = {
+    section: tuple((out_key, _make_accessor(path)) for path, out_key in mapping.items())
+    for section, mapping in (
+        ("edge_put_get", EDGE_SUMMARY_TO_BASELINE_KEYS),
+        ("scheduler_loop", SCHED_SUMMARY_TO_BASELINE_KEYS),
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Detail:
+    baseline: float
+    current: float
+    direction: str
+    delta_pct: float
+    threshold_pct: float
+    verdict: str
+
+
 @dataclass
 class CompareConfig:
     current_path: Path
@@ -133,6 +206,7 @@ class CompareConfig:
     threshold_pct: float
     warn_only: bool
     section: str | None
+    cache_baseline: bool = False
 
 
 # ---------------------------
@@ -140,16 +214,63 @@ class CompareConfig:
 # ---------------------------
 
 
-def _load_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def _parse_json_bytes(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed. Documents orjson rejects
+    (e.g. NaN/Infinity literals written by the stdlib encoder) fall back to json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _load_json(path: Path, *, cache: bool = False) -> dict[str, Any]:
+    """
+    Parse a JSON file. With cache=True the parsed document is also stored next to the
+    file as <name>.cache (marshal format) and reused while the source's mtime and size
+    are unchanged. Cache problems are never fatal; the JSON is parsed instead.
+    """
+    if not cache:
+        return _parse_json_bytes(path.read_bytes())
+
+    st = path.stat()
+    key = (_CACHE_FORMAT, st.st_mtime_ns, st.st_size)
+    cache_path = path.with_name(path.name + ".cache")
+    try:
+        cached_key, doc = marshal.loads(cache_path.read_bytes())
+        if cached_key == key:
+            return doc
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    doc = _parse_json_bytes(path.read_bytes())
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_bytes(marshal.dumps((key, doc)))
+        os.replace(tmp, cache_path)
+    except (OSError, ValueError):
+        tmp.unlink(missing_ok=True)
+    return doc
+
+
+def _write_report(doc: dict[str, Any]) -> None:
+    """
+    Write doc to stdout as sorted, 2-space indented JSON followed by a newline, encoding
+    incrementally into the stream instead of building an intermediate str.
+    """
+    out = sys.stdout
+    json.dump(doc, out, indent=2, sort_keys=True)
+    out.write("\n")
 
 
 def _get_env_bool(name: str, default: bool = False) -> bool:
     v = os.getenv(name)
     if v is None:
         return default
-    return v.lower() in ("1", "true", "yes", "on")
+    return v.lower() in _TRUTHY
 
 
 def _get_env_float(name: str, default: float) -> float:
@@ -181,74 +302,88 @@ def _infer_section(current: dict[str, Any], override: str | None) -> str | None:
     return None
 
 
-def _flatten_current_to_metrics(current: dict[str, Any], section: str | None) -> dict[str, float]:
+def _flatten_current_to_metrics(
+    current: dict[str, Any],
+    section: str | None,
+    wanted: Collection[str] | None = None,
+) -> dict[str, float]:
     """
     Extracts a normalized metric dict from the current document using known conventions.
     Keys will match baseline metric names where possible.
+
+    If `wanted` is given (typically the baseline section's metric names), only those
+    metrics are looked up; everything else in the document is left untouched.
     """
     metrics: dict[str, float] = {}
 
+    def _want(key: str) -> bool:
+        return wanted is None or key in wanted
+
     # If section isn't known, try to discover by available fields (edge or scheduler shapes)
     sec = section or current.get("name")
 
-    # Edge bench shape
-    if sec == "edge_put_get":
-        # Map current.summary.ops_per_sec.{no_metrics,prom_metrics} -> baseline keys
-        for key_path, out_key in EDGE_SUMMARY_TO_BASELINE_KEYS.items():
-            try:
-                val = _get_nested(current, *key_path)
-                if val is not None:
-                    metrics[out_key] = float(val)
-            except Exception:
-                # tolerate missing keys
-                pass
-
-    # Scheduler bench shape
-    if sec == "scheduler_loop":
-        for key_path, out_key in SCHED_SUMMARY_TO_BASELINE_KEYS.items():
+    # Known bench shapes: walk only the mapped key paths
+    accessors = _SECTION_ACCESSORS.get(sec) if isinstance(sec, str) else None
+    if accessors is not None:
+        for out_key, get in accessors:
+            if not _want(out_key):
+                continue
             try:
-                val = _get_nested(current, *key_path)
-                if val is not None:
-                    metrics[out_key] = float(val)
-            except Exception:
+                metrics[out_key] = float(get(current))
+            except (KeyError, TypeError, ValueError):
+                # tolerate missing paths and non-numeric values
                 pass
 
-    # Generic fallbacks: copy any numeric summary fields directly if they match baseline names
-    if "summary" in current and isinstance(current["summary"], dict):
-        for k, v in current["summary"].items():
-            if isinstance(v, int | float) and k not in metrics:
-                metrics[k] = float(v)
-
-    # Also permit a "metrics" top-level numeric map
-    if "metrics" in current and isinstance(current["metrics"], dict):
-        for k, v in current["metrics"].items():
-            if isinstance(v, int | float) and k not in metrics:
-                metrics[k] = float(v)
+    # Generic fallbacks: copy numeric "summary" fields, then a top-level "metrics" map, when
+    # their names match the wanted baseline keys
+    for container in ("summary", "metrics"):
+        fields = current.get(container)
+        if not isinstance(fields, dict):
+            continue
+        if wanted is None:
+            items = fields.items()
+        else:
+            items = ((k, fields[k]) for k in wanted if k in fields)
+        # Exact type test: JSON numbers decode to int/float, and bools are not measurements
+        present = metrics.keys()
+        metrics.update(
+            (k, float(v)) for k, v in items if type(v) in _NUMBER_TYPES and k not in present
+        )
 
     return metrics
 
 
-def _get_nested(obj: dict[str, Any], *keys: str) -> Any:
-    cur = obj
-    for k in keys:
-        if isinstance(cur, dict) and k in cur:
-            cur = cur[k]
-        else:
-            return None
-    return cur
-
-
 # ---------------------------
 # Comparison logic
 # ---------------------------
 
 
+def _prepare_rows(
+    base_section: dict[str, Any],
+) -> list[tuple[str, int | float, float, tuple[str, bool, str]]]:
+    """
+    Flatten a baseline section into (metric, raw_value, value, direction) rows, keeping only
+    numeric entries and resolving each metric's direction once. Unknown metrics default to
+    higher-is-better.
+
+    Metric names are interned so later lookups against the module's literal keys (already
+    interned by the compiler) hit on identity.
+    """
+    get_direction = _DIRECTION_CMP.get
+    intern = sys.intern
+    return [
+        (name, value, float(value), get_direction(name, _HIGHER_IS_BETTER))
+        for name, value in ((intern(m), v) for m, v in base_section.items())
+        if isinstance(value, int | float) and name != "version"
+    ]
+
+
 def _compare_metrics(
     section: str,
     baseline: dict[str, Any],
     current_metrics: dict[str, float],
     threshold_pct: float,
-) -> tuple[bool, dict[str, Any], dict[str, str]]:
+) -> tuple[bool, dict[str, _Detail], dict[str, str]]:
     """
     Compare current_metrics against baseline[section].
 
@@ -260,7 +395,7 @@ def _compare_metrics(
       messages: human-readable messages for logs
     """
     ok = True
-    details: dict[str, Any] = {}
+    details: dict[str, _Detail] = {}
     messages: dict[str, str] = {}
 
     base_section = baseline.get(section, {})
@@ -270,10 +405,13 @@ def _compare_metrics(
         )
         return True, details, messages  # do not fail if section isn't present
 
-    for metric, base_value in base_section.items():
-        if not isinstance(base_value, int | float):
-            continue
+    rows = _prepare_rows(base_section)
+    if not rows:
+        # Nothing numeric to compare
+        return True, details, messages
 
+    threshold = float(threshold_pct)
+    for metric, base_value, base, (direction, higher_is_better, delta_label) in rows:
         cur_value = current_metrics.get(metric)
         if cur_value is None:
             messages[metric] = (
@@ -281,59 +419,30 @@ def _compare_metrics(
             )
             continue
 
-        higher_is_better = METRIC_DIRECTIONS.get(metric, True)
-        if higher_is_better:
-            # regression if current < baseline
-            delta_pct = _pct_drop(baseline=base_value, current=cur_value)
-            regressed = delta_pct > threshold_pct
-            verdict = "OK" if not regressed else "REGRESSED"
-            if regressed:
-                ok = False
-        else:
-            # lower is better: regression if current > baseline
-            delta_pct = _pct_increase(baseline=base_value, current=cur_value)
-            regressed = delta_pct > threshold_pct
-            verdict = "OK" if not regressed else "REGRESSED"
-            if regressed:
-                ok = False
-
-        details[metric] = {
-            "baseline": float(base_value),
-            "current": float(cur_value),
-            "direction": "higher_is_better" if higher_is_better else "lower_is_better",
-            "delta_pct": float(delta_pct),
-            "threshold_pct": float(threshold_pct),
-            "verdict": verdict,
-        }
-
-        if higher_is_better:
-            messages[metric] = (
-                f"{metric}: current={cur_value:.6g}, baseline={base_value:.6g}, "
-                f"drop={delta_pct:.2f}% [{verdict}]"
+        # Regression percent: drop for higher-is-better, increase for lower-is-better;
+        # clamped at zero and zero for a non-positive baseline
+        if base > 0:
+            delta_pct = (
+                ((base - cur_value) if higher_is_better else (cur_value - base)) / base * 100.0
             )
+            if not delta_pct > 0:
+                delta_pct = 0.0
         else:
-            messages[metric] = (
-                f"{metric}: current={cur_value:.6g}, baseline={base_value:.6g}, "
-                f"increase={delta_pct:.2f}% [{verdict}]"
-            )
+            delta_pct = 0.0
+        regressed = delta_pct > threshold
+        verdict = "REGRESSED" if regressed else "OK"
+        if regressed:
+            ok = False
+
+        details[metric] = _Detail(base, float(cur_value), direction, delta_pct, threshold, verdict)
+        messages[metric] = (
+            f"{metric}: current={cur_value:.6g}, baseline={base_value:.6g}, "
+            f"{delta_label}={delta_pct:.2f}% [{verdict}]"
+        )
 
     return ok, details, messages
 
 
-def _pct_drop(baseline: float, current: float) -> float:
-    if baseline <= 0:
-        return 0.0
-    drop = (baseline - current) / baseline * 100.0
-    return max(0.0, drop)
-
-
-def _pct_increase(baseline: float, current: float) -> float:
-    if baseline <= 0:
-        return 0.0
-    inc = (current - baseline) / baseline * 100.0
-    return max(0.0, inc)
-
-
 # ---------------------------
 # I/O and CLI
 # ---------------------------
@@ -388,25 +497,29 @@ def _parse_args(argv: list[str]) -> CompareConfig:
         threshold_pct=threshold,
         warn_only=warn_only,
         section=args.section or os.getenv("MERIDIAN_BENCH_BASELINE_SECTION"),
+        cache_baseline=_get_env_bool("MERIDIAN_BENCH_CACHE", False),
     )
 
 
 def _main(argv: list[str]) -> int:
     cfg = _parse_args(argv)
 
-    if not cfg.current_path.exists():
-        print(json.dumps({"error": f"Current file not found: {cfg.current_path}"}))
-        return 1
-    if not cfg.baseline_path.exists():
-        print(json.dumps({"error": f"Baseline file not found: {cfg.baseline_path}"}))
-        return 1
-
-    try:
-        current = _load_json(cfg.current_path)
-        baseline = _load_json(cfg.baseline_path)
-    except Exception as e:
-        print(json.dumps({"error": f"Failed to read JSON: {e}"}))
-        return 1
+    # Open each file once and map a missing file to its own error, rather than probing
+    # with exists() first
+    docs: list[dict[str, Any]] = []
+    for label, path, cache in (
+        ("Current", cfg.current_path, False),
+        ("Baseline", cfg.baseline_path, cfg.cache_baseline),
+    ):
+        try:
+            docs.append(_load_json(path, cache=cache))
+        except FileNotFoundError:
+            print(dumps_doc({"error": f"{label} file not found: {path}"}, pretty=False))
+            return 1
+        except Exception as e:
+            print(dumps_doc({"error": f"Failed to read JSON: {e}"}, pretty=False))
+            return 1
+    current, baseline = docs
 
     # Infer section if necessary
     section = _infer_section(current, cfg.section)
@@ -414,16 +527,40 @@ def _main(argv: list[str]) -> int:
         # If we cannot infer, compare all sections that match the current "name" if present,
         # otherwise bail with an informative message.
         print(
-            json.dumps(
+            dumps_doc(
                 {
                     "error": "Unable to infer section; provide --section or include 'name' in current JSON"
-                }
+                },
+                pretty=False,
             )
         )
         return 1
 
+    # Baseline sections record the document version their numbers were taken with
+    # (absent means 1); a different version measures a different workload.
+    base_section = baseline.get(section)
+    if isinstance(base_section, dict):
+        base_version = base_section.get("version", 1)
+        cur_version = current.get("version", 1)
+        if cur_version != base_version:
+            print(
+                dumps_doc(
+                    {
+                        "error": f"Section '{section}' baseline is version {base_version} but "
+                        f"current is version {cur_version}; regenerate the baseline"
+                    },
+                    pretty=False,
+                )
+            )
+            return 1
+
     # Extract metrics from current and compare
-    current_metrics = _flatten_current_to_metrics(current, section)
+    wanted = (
+        {k for k, v in base_section.items() if isinstance(v, int | float) and k != "version"}
+        if isinstance(base_section, dict)
+        else set()
+    )
+    current_metrics = _flatten_current_to_metrics(current, section, wanted)
     ok, details, messages = _compare_metrics(section, baseline, current_metrics, cfg.threshold_pct)
 
     result_doc = {
@@ -431,11 +568,11 @@ def _main(argv: list[str]) -> int:
         "threshold_pct": cfg.threshold_pct,
         "warn_only": cfg.warn_only,
         "ok": ok or cfg.warn_only,
-        "details": details,
+        "details": {metric: asdict(d) for metric, d in details.items()},
         "messages": messages,
     }
 
-    print(json.dumps(result_doc, indent=2, sort_keys=True))
+    _write_report(result_doc)
 
     if ok:
         return 0
@@ -40,26 +40,48 @@ import sys
 from collections.abc import Iterable
 from pathlib import Path
 
+_FENCE = b"```"
+# Whitespace allowed around a bare fence; \r covers CRLF line endings
+_FENCE_WS = b" \t\f\v\r"
+
+_MD_SUFFIXES = frozenset((".md", ".markdown"))
+
+
+def _scan(data: bytes) -> list[tuple[int, str]]:
+    results: list[tuple[int, str]] = []
+    line_no = 1
+    pos = 0
+    # Jump between ``` occurrences with a C-level substring search and only inspect the
+    # lines that contain one; every other line is skipped without being touched
+    i = data.find(_FENCE)
+    while i != -1:
+        line_start = data.rfind(b"\n", 0, i) + 1
+        line_end = data.find(b"\n", i)
+        if line_end == -1:
+            line_end = len(data)
+        line = data[line_start:line_end]
+        if line.strip(_FENCE_WS) == _FENCE:
+            # Count newlines incrementally so each byte is only counted once
+            line_no += data.count(b"\n", pos, line_start)
+            pos = line_start
+            results.append((line_no, line.removesuffix(b"\r").decode("utf-8", errors="ignore")))
+        i = data.find(_FENCE, line_end)
+    return results
+
 
 def find_bare_fences(path: Path) -> list[tuple[int, str]]:
     """
     Return a list of (line_number, line_content) where a bare fence is found.
 
-    A "bare fence" is a line that, after stripping trailing newline characters,
-    is exactly three backticks with no language specifier.
+    A "bare fence" is a line that, after stripping surrounding whitespace, is exactly
+    three backticks with no language specifier. The file is scanned as bytes, and only
+    lines containing ``` are examined.
     """
-    results: list[tuple[int, str]] = []
     try:
-        # Use strict UTF-8 with fallback to ignoring errors to avoid crashes
-        with path.open("r", encoding="utf-8", errors="ignore") as f:
-            for i, raw in enumerate(f, start=1):
-                line = raw.rstrip("\n")
-                # Normalize whitespace; we consider only pure "```" as bare
-                if line.strip() == "```":
-                    results.append((i, line))
+        return _scan(path.read_bytes())
     except Exception as e:
         print(f"ERROR: Could not read {path}: {e}", file=sys.stderr)
-    return results
+    return []
 
 
 def iter_md_files(files: Iterable[str]) -> Iterable[Path]:
@@ -69,7 +91,7 @@ def iter_md_files(files: Iterable[str]) -> Iterable[Path]:
     for p in files:
         path = Path(p)
         # Only check existing markdown files
-        if path.suffix.lower() in {".md", ".markdown"} and path.exists():
+        if path.suffix.lower() in _MD_SUFFIXES and path.exists():
             yield path
 
 
@@ -3,40 +3,49 @@
 Script to create Jupyter notebooks for Meridian Runtime tutorials and examples.
 """
 
+import argparse
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def create_cell(cell_type: str, source: str, metadata: dict = None) -> dict:
     """Create a notebook cell."""
     return {
         "cell_type": cell_type,
         "metadata": metadata or {},
-        "source": source.splitlines(keepends=True),
+        "source": source,
         "execution_count": None,
         "outputs": []
     }
 
+# Shared by every generated notebook; it is only ever serialized, never mutated.
+DEFAULT_NOTEBOOK_METADATA = {
+    "kernelspec": {
+        "display_name": "Python 3",
+        "language": "python",
+        "name": "python3"
+    },
+    "language_info": {
+        "codemirror_mode": {"name": "ipython", "version": 3},
+        "file_extension": ".py",
+        "mimetype": "text/x-python",
+        "name": "python",
+        "nbconvert_exporter": "python",
+        "pygments_lexer": "ipython3",
+        "version": "3.11.0"
+    }
+}
+
 def create_notebook(cells: list, metadata: dict = None) -> dict:
     """Create a complete notebook."""
     return {
         "cells": cells,
-        "metadata": metadata or {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            },
-            "language_info": {
-                "codemirror_mode": {"name": "ipython", "version": 3},
-                "file_extension": ".py",
-                "mimetype": "text/x-python",
-                "name": "python",
-                "nbconvert_exporter": "python",
-                "pygments_lexer": "ipython3",
-                "version": "3.11.0"
-            }
-        },
+        "metadata": metadata or DEFAULT_NOTEBOOK_METADATA,
         "nbformat": 4,
         "nbformat_minor": 4
     }
@@ -520,8 +529,42 @@ Happy building with Meridian Runtime! 🚀
     
     return create_notebook(cells)
 
-def main():
+def write_notebook(path: Path, notebook: dict, *, pretty: bool = False) -> bool:
+    """Serialize a notebook to disk, skipping the write if the file is unchanged.
+
+    Output is compact JSON unless ``pretty`` asks for two-space indentation.
+    Uses orjson when it is installed. Returns True if the file was written.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        data = orjson.dumps(notebook, option=option)
+    else:
+        if pretty:
+            text = json.dumps(notebook, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(notebook, separators=(",", ":"), ensure_ascii=False)
+        data = (text + "\n").encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+# (path under notebooks/, factory) pairs; each factory builds one notebook dict.
+# Builds are a few microseconds each, so they run serially in main().
+NOTEBOOKS = [
+    ("tutorials/01-getting-started.ipynb", create_getting_started_notebook),
+]
+
+def main(argv=None):
     """Create all notebooks."""
+    parser = argparse.ArgumentParser(description="Create the Meridian Runtime notebooks.")
+    parser.add_argument(
+        "--pretty", action="store_true", help="indent the notebook JSON for readable diffs"
+    )
+    args = parser.parse_args(argv)
     
     # Create notebooks directory structure
     notebooks_dir = Path("notebooks")
@@ -532,15 +575,14 @@ def main():
     for dir_path in [notebooks_dir, tutorials_dir, examples_dir, research_dir]:
         dir_path.mkdir(exist_ok=True)
     
-    # Create getting started notebook
-    getting_started = create_getting_started_notebook()
-    
-    with open(tutorials_dir / "01-getting-started.ipynb", "w") as f:
-        json.dump(getting_started, f, indent=2)
-    
-    print("✅ Created notebooks/tutorials/01-getting-started.ipynb")
+    for relpath, factory in NOTEBOOKS:
+        path = notebooks_dir / relpath
+        if write_notebook(path, factory(), pretty=args.pretty):
+            print(f"✅ Created {path}")
+        else:
+            print(f"✅ {path} is up to date")
     
-    # TODO: Create additional notebooks
+    # TODO: Create additional notebooks (add them to NOTEBOOKS)
     # - 02-backpressure-policies.ipynb
     # - 03-control-plane-priorities.ipynb
     # - 04-observability-basics.ipynb
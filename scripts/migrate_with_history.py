@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import shutil
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -33,6 +36,8 @@ class StatusReporter:
         self._last_activity = time.monotonic()
         self._stop_event = threading.Event()
         self._heartbeat_thread: threading.Thread | None = None
+        # Splits and the heartbeat log from worker threads; keep each line whole
+        self._print_lock = threading.Lock()
 
     def start_heartbeat(self, interval_seconds: float = 30.0) -> None:
         if self._heartbeat_thread is not None:
@@ -76,10 +81,11 @@ class StatusReporter:
                 event["duration_ms"] = duration_ms
             if commit is not None:
                 event["commit"] = commit
-            print(json.dumps(event))
+            line = json.dumps(event, separators=(",", ":"))
         else:
-            prefix = f"[{phase}:{step}]"
-            print(prefix, message)
+            line = f"[{phase}:{step}] {message}"
+        with self._print_lock:
+            print(line)
 
     def banner(self, phase: str, step: str, detail: str | None = None) -> None:
         msg = f"{phase.upper()} ▸ {step}"
@@ -88,32 +94,53 @@ class StatusReporter:
         self.log("info", phase=phase, step=step, message=msg)
 
 
+@functools.lru_cache(maxsize=1)
+def git_executable() -> str | None:
+    # Resolve git on PATH once; every later spawn execs the absolute path directly
+    return shutil.which("git")
+
+
 def run_git(args: list[str], reporter: StatusReporter | None = None, cwd: Path | None = None, dry_run: bool = False, stream: bool = False) -> str:
-    cmd = ["git", *args]
     if dry_run:
-        print("$", " ".join(cmd))
+        print("$", " ".join(["git", *args]))
         return ""
+    # Output is always captured or piped, so never start a pager; read-only commands
+    # such as status should not take the index lock just to refresh stat data.
+    cmd = [git_executable() or "git", "--no-pager", "--no-optional-locks", *args]
     if stream:
-        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
         assert proc.stdout is not None
-        output_lines: list[str] = []
-        for line in proc.stdout:
-            output_lines.append(line)
-            sys.stdout.write(line)
-            sys.stdout.flush()
+        # Relay raw blocks rather than decoded lines: subtree split prints a progress
+        # line per commit, and the bytes only need decoding once at the end.
+        sink = getattr(sys.stdout, "buffer", None)
+        sys.stdout.flush()
+        fd = proc.stdout.fileno()
+        output_chunks: list[bytes] = []
+        while chunk := os.read(fd, 65536):
+            output_chunks.append(chunk)
+            if sink is not None:
+                sink.write(chunk)
+                sink.flush()
+            else:
+                sys.stdout.write(chunk.decode("utf-8", "replace"))
+                sys.stdout.flush()
             if reporter is not None:
                 reporter.touch()
+        proc.stdout.close()
         proc.wait()
         if proc.returncode != 0:
             raise RuntimeError(f"git {' '.join(args)} failed (code {proc.returncode})")
-        return "".join(output_lines).strip()
+        return b"".join(output_chunks).decode("utf-8", "replace").strip()
     else:
-        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        # Capture raw bytes: stderr is only decoded when the command fails
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True)
         if reporter is not None:
             reporter.touch()
+        stdout = proc.stdout.decode("utf-8", "replace")
         if proc.returncode != 0:
-            raise RuntimeError(f"git {' '.join(args)} failed (code {proc.returncode})\nSTDOUT:\n{proc.stdout}\nSTDERR:\n{proc.stderr}")
-        return proc.stdout.strip()
+            stderr = proc.stderr.decode("utf-8", "replace")
+            raise RuntimeError(f"git {' '.join(args)} failed (code {proc.returncode})\nSTDOUT:\n{stdout}\nSTDERR:\n{stderr}")
+        return stdout.strip()
 
 
 def check_clean_working_tree(reporter: StatusReporter, dry_run: bool = False) -> None:
@@ -132,6 +159,26 @@ def create_split_branch(prefix: str, split_branch: str, reporter: StatusReporter
     run_git(["subtree", "split", f"--prefix={prefix}", "-b", split_branch], reporter=reporter, dry_run=dry_run, stream=stream)
 
 
+def timed_split(prefix: str, split_branch: str, reporter: StatusReporter, dry_run: bool, stream: bool) -> int:
+    t0 = time.monotonic()
+    create_split_branch(prefix, split_branch, reporter, dry_run=dry_run, stream=stream)
+    return int((time.monotonic() - t0) * 1000)
+
+
+def split_is_current(split_branch: str, split_head: str | None, head: str, reporter: StatusReporter, dry_run: bool) -> bool:
+    # A checkpointed split can be reused when HEAD has not moved since it was taken
+    # (older checkpoints carry no head) and its branch is still present.
+    if dry_run:
+        return True
+    if split_head is not None and split_head != head:
+        return False
+    try:
+        run_git(["rev-parse", "--verify", "--quiet", f"refs/heads/{split_branch}"], reporter=reporter)
+    except RuntimeError:
+        return False
+    return True
+
+
 def ensure_remote(remote_name: str, remote_url: str | None, reporter: StatusReporter, dry_run: bool) -> None:
     remotes = run_git(["remote"], reporter=reporter, dry_run=dry_run)
     if not dry_run and remote_name in (remotes.split() if remotes else []):
@@ -148,12 +195,16 @@ def ensure_remote(remote_name: str, remote_url: str | None, reporter: StatusRepo
     run_git(["remote", "add", remote_name, remote_url], reporter=reporter, dry_run=False)
 
 
-def push_split(remote: str, split_branch: str, target_branch: str, reporter: StatusReporter, dry_run: bool) -> None:
-    run_git(["push", remote, f"{split_branch}:{target_branch}"], reporter=reporter, dry_run=dry_run)
+def push_splits(remote: str, refspecs: list[tuple[str, str]], reporter: StatusReporter, dry_run: bool) -> None:
+    # One push for every (split_branch, target_branch) pair: a single transport handshake
+    if refspecs:
+        run_git(["push", remote, *(f"{split}:{target}" for split, target in refspecs)], reporter=reporter, dry_run=dry_run)
 
 
-def delete_branch(branch: str, reporter: StatusReporter, dry_run: bool) -> None:
-    run_git(["branch", "-D", branch], reporter=reporter, dry_run=dry_run)
+def delete_branches(branches: list[str], reporter: StatusReporter, dry_run: bool) -> None:
+    # git branch -D accepts several names, so one process removes them all
+    if branches:
+        run_git(["branch", "-D", *branches], reporter=reporter, dry_run=dry_run)
 
 
 def parse_args() -> MigrationConfig:
@@ -220,7 +271,7 @@ def main() -> int:
         checkpoint = load_checkpoint(config.status_file)
     try:
         # Basic preflight checks
-        if shutil.which("git") is None:
+        if git_executable() is None:
             raise SystemExit("git is required on PATH")
         reporter.banner("prepare", "preflight", "checking tooling and working tree")
         check_clean_working_tree(reporter, dry_run=config.dry_run)
@@ -245,37 +296,77 @@ def main() -> int:
         # For each prefix, create a split branch and push
         split_branches: list[str] = checkpoint.get("split_branches", [])
         completed_splits: set[str] = set(checkpoint.get("completed_splits", []))
+        split_heads: dict[str, str] = checkpoint.get("split_heads", {})
+        already_pushed = checkpoint.get("pushed", False)
+        # Record the commit each split was taken from so a resume can tell whether it is stale
+        head = run_git(["rev-parse", "HEAD"], reporter=reporter, dry_run=config.dry_run) if config.status_file is not None else ""
+        pending: list[tuple[str, str]] = []
         for prefix in config.prefixes:
             split_branch = f"subtree-split/{prefix.replace('/', '_')}"
-            if split_branch in completed_splits:
+            if split_branch in completed_splits and (
+                already_pushed or split_is_current(split_branch, split_heads.get(split_branch), head, reporter, config.dry_run)
+            ):
                 continue
-            reporter.banner("migrate", "split", f"{prefix} -> {split_branch}")
-            # Stream output for subtree split on verbosity >= 1
-            stream = config.verbose >= 1 and not config.json_output
-            t0 = time.monotonic()
-            create_split_branch(prefix, split_branch, reporter, dry_run=config.dry_run, stream=stream)
-            dt_ms = int((time.monotonic() - t0) * 1000)
+            pending.append((prefix, split_branch))
+        # Stream output for subtree split on verbosity >= 1
+        stream = config.verbose >= 1 and not config.json_output
+
+        def record_split(split_branch: str, dt_ms: int) -> None:
             reporter.log("info", phase="migrate", step="split", message=f"created split {split_branch}", progress=None, duration_ms=dt_ms)
-            split_branches.append(split_branch)
+            if split_branch not in split_branches:
+                split_branches.append(split_branch)
             if config.status_file is not None:
                 checkpoint["split_branches"] = split_branches
-                checkpoint.setdefault("completed_splits", []).append(split_branch)
+                if split_branch not in completed_splits:
+                    checkpoint.setdefault("completed_splits", []).append(split_branch)
+                checkpoint.setdefault("split_heads", {})[split_branch] = head
                 save_checkpoint(config.status_file, checkpoint)
 
+        if stream or len(pending) <= 1:
+            # Streamed git output is relayed straight to stdout, so splits run one at a
+            # time to keep each prefix's output under its own banner.
+            for prefix, split_branch in pending:
+                reporter.banner("migrate", "split", f"{prefix} -> {split_branch}")
+                record_split(split_branch, timed_split(prefix, split_branch, reporter, config.dry_run, stream))
+        else:
+            # Each split only reads history and writes its own branch ref, so the
+            # prefixes are split concurrently. A split announces itself when it starts
+            # and is checkpointed as soon as it finishes; a failure is raised only once
+            # every other split has finished and been recorded, so a resume skips them.
+            def run_split(prefix: str, split_branch: str) -> int:
+                reporter.banner("migrate", "split", f"{prefix} -> {split_branch}")
+                return timed_split(prefix, split_branch, reporter, config.dry_run, stream)
+
+            failure: Exception | None = None
+            with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as pool:
+                futures = {pool.submit(run_split, prefix, split_branch): split_branch for prefix, split_branch in pending}
+                for future in as_completed(futures):
+                    split_branch = futures[future]
+                    try:
+                        dt_ms = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        reporter.log("error", phase="migrate", step="split", message=f"split {split_branch} failed: {exc}")
+                        failure = failure or exc
+                        continue
+                    record_split(split_branch, dt_ms)
+            if failure is not None:
+                raise failure
+
         if not checkpoint.get("pushed", False):
+            refspecs: list[tuple[str, str]] = []
             for split_branch in split_branches:
                 target = config.target_branch or split_branch
                 reporter.banner("migrate", "push", f"{split_branch} -> {config.remote_name}:{target}")
-                push_split(config.remote_name, split_branch, target, reporter, dry_run=config.dry_run)
+                refspecs.append((split_branch, target))
+            push_splits(config.remote_name, refspecs, reporter, dry_run=config.dry_run)
             if config.status_file is not None:
                 checkpoint["pushed"] = True
                 save_checkpoint(config.status_file, checkpoint)
 
         # Cleanup local split branches
         if not checkpoint.get("cleaned", False):
-            for split_branch in split_branches:
-                reporter.banner("integrate", "cleanup", f"{split_branch}")
-                delete_branch(split_branch, reporter, dry_run=config.dry_run)
+            reporter.banner("integrate", "cleanup", ", ".join(split_branches))
+            delete_branches(split_branches, reporter, dry_run=config.dry_run)
             if config.status_file is not None:
                 checkpoint["cleaned"] = True
                 save_checkpoint(config.status_file, checkpoint)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import shutil
 import subprocess
 import tarfile
-from datetime import datetime
+import time
 from pathlib import Path
 
 BACKUP_DIR = Path(".meridian") / "artifacts" / "migration-backups"
@@ -22,12 +23,31 @@ def ensure_clean_working_tree() -> None:
         raise SystemExit("Working tree not clean. Commit or stash changes before backup.")
 
 
+def _add_paths(tar: tarfile.TarFile, paths: list[Path]) -> None:
+    for p in paths:
+        if p.exists():
+            tar.add(str(p), arcname=str(p))
+
+
 def archive_paths(paths: list[Path], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(out_path, "w:gz") as tar:
-        for p in paths:
-            if p.exists():
-                tar.add(str(p), arcname=str(p))
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(out_path, "w:gz") as tar:
+            _add_paths(tar, paths)
+        return
+    # pigz compresses on all cores and emits ordinary gzip, so the archive format is unchanged
+    with open(out_path, "wb") as out:
+        proc = subprocess.Popen([pigz, "-c"], stdin=subprocess.PIPE, stdout=out)
+        assert proc.stdin is not None
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                _add_paths(tar, paths)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+    if proc.returncode != 0:
+        raise RuntimeError(f"pigz failed (code {proc.returncode})")
 
 
 def main() -> int:
@@ -38,7 +58,7 @@ def main() -> int:
 
     ensure_clean_working_tree()
 
-    dt = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    dt = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
     tag = f"{args.tag_prefix}/{dt}"
 
     # Create a lightweight tag as an anchor point
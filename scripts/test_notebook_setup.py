@@ -3,58 +3,29 @@
 Test script to validate Jupyter notebook setup for Meridian Runtime.
 """
 
+import importlib.util
 import json
 import sys
 from pathlib import Path
 
+# Third-party packages the notebooks need; only their presence is checked here.
+NOTEBOOK_MODULES = ["matplotlib", "ipywidgets", "plotly", "pandas", "networkx", "seaborn"]
 
 def test_imports():
-    """Test that all required libraries can be imported."""
+    """Test that all required libraries are installed."""
     print("Testing imports...")
     
-    try:
-        import matplotlib.pyplot as plt
-        print("✅ matplotlib imported successfully")
-    except ImportError as e:
-        print(f"❌ matplotlib import failed: {e}")
-        return False
-    
-    try:
-        import ipywidgets as widgets
-        print("✅ ipywidgets imported successfully")
-    except ImportError as e:
-        print(f"❌ ipywidgets import failed: {e}")
-        return False
-    
-    try:
-        import plotly.graph_objects as go
-        print("✅ plotly imported successfully")
-    except ImportError as e:
-        print(f"❌ plotly import failed: {e}")
-        return False
-    
-    try:
-        import pandas as pd
-        print("✅ pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ pandas import failed: {e}")
-        return False
-    
-    try:
-        import networkx as nx
-        print("✅ networkx imported successfully")
-    except ImportError as e:
-        print(f"❌ networkx import failed: {e}")
-        return False
-    
-    try:
-        import seaborn as sns
-        print("✅ seaborn imported successfully")
-    except ImportError as e:
-        print(f"❌ seaborn import failed: {e}")
-        return False
-    
-    return True
+    # find_spec locates each package without importing it, which skips
+    # matplotlib's backend and font-cache setup and the pandas/plotly import graphs.
+    ok = True
+    for name in NOTEBOOK_MODULES:
+        if importlib.util.find_spec(name) is None:
+            print(f"❌ {name} is not installed")
+            ok = False
+        else:
+            print(f"✅ {name} is installed")
+    
+    return ok
 
 def test_meridian_import():
     """Test that Meridian Runtime can be imported."""
@@ -2,19 +2,26 @@ from __future__ import annotations
 
 import time
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from itertools import islice
+from typing import Any, Generic, TypeVar
 
 from ...observability.logging import get_logger, with_context
 from ...observability.metrics import Metrics, get_metrics
 from ..message import Message
-from ..policies import Coalesce, Latest, Policy, PutResult
+from ..policies import Block, Coalesce, Drop, Latest, Policy, PutResult
 from ..ports import Port, PortSpec
 
 T = TypeVar("T")
 
+# Policies are stateless, so edges without an explicit policy share one Latest instance
+_DEFAULT_POLICY = Latest()
+# Built-in policies accept every item while the queue is below capacity
+_ACCEPT_BELOW_CAPACITY = (Block, Drop, Latest, Coalesce)
 
-@dataclass
+
+@dataclass(slots=True)
 class Edge(Generic[T]):
     source_node: str
     source_port: Port
@@ -25,17 +32,19 @@ class Edge(Generic[T]):
     default_policy: Policy[T] | None = None
     _q: deque[T] = field(default_factory=deque, init=False, repr=False)
     _metrics: Metrics = field(default_factory=lambda: get_metrics(), init=False, repr=False)
-    _enq = None
-    _deq = None
-    _drops = None
-    _depth = None
-    _blocked_time = None
+    _enq: Any = field(default=None, init=False, repr=False, compare=False)
+    _deq: Any = field(default=None, init=False, repr=False, compare=False)
+    _drops: Any = field(default=None, init=False, repr=False, compare=False)
+    _depth: Any = field(default=None, init=False, repr=False, compare=False)
+    _blocked_time: Any = field(default=None, init=False, repr=False, compare=False)
+    _id: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self._init_metrics()
 
     def _init_metrics(self) -> None:
         edge_id = f"{self.source_node}:{self.source_port.name}->{self.target_node}:{self.target_port.name}"
+        self._id = edge_id
         edge_labels = {"edge_id": edge_id}
         self._enq = self._metrics.counter("edge_enqueued_total", edge_labels)
         self._deq = self._metrics.counter("edge_dequeued_total", edge_labels)
@@ -50,7 +59,8 @@ class Edge(Generic[T]):
         return d
 
     def _edge_id(self) -> str:
-        return f"{self.source_node}:{self.source_port.name}->{self.target_node}:{self.target_port.name}"
+        # Formatted once with the metric labels; logging and backpressure paths reuse it
+        return self._id
 
     def _coalesce(self, fn: Coalesce, new_item: T) -> None:
         logger = get_logger()
@@ -76,31 +86,31 @@ class Edge(Generic[T]):
             with with_context(edge_id=self._edge_id()):
                 logger.warn("edge.validation_failed", "Item does not conform to PortSpec schema")
             raise TypeError("item does not conform to PortSpec schema")
-        pol = policy or self.default_policy or Latest()
+        pol = policy or self.default_policy or _DEFAULT_POLICY
         res = pol.on_enqueue(self.capacity, len(self._q), item)
         with with_context(edge_id=self._edge_id()):
-            if res == PutResult.OK:
+            if res is PutResult.OK:
                 self._q.append(item)
                 if self._enq:
                     self._enq.inc(1)
                 logger.debug("edge.enqueue", f"Item enqueued, depth={len(self._q)}")
-            elif res == PutResult.REPLACED:
+            elif res is PutResult.REPLACED:
                 if self._q:
                     self._q.pop()
                 self._q.append(item)
                 if self._enq:
                     self._enq.inc(1)
                 logger.debug("edge.replace", f"Item replaced, depth={len(self._q)}")
-            elif res == PutResult.DROPPED:
+            elif res is PutResult.DROPPED:
                 if self._drops:
                     self._drops.inc(1)
                 logger.debug("edge.drop", "Item dropped due to capacity limit")
-            elif res == PutResult.COALESCED and isinstance(pol, Coalesce):
+            elif res is PutResult.COALESCED and isinstance(pol, Coalesce):
                 self._coalesce(pol, item)
                 if self._enq:
                     self._enq.inc(1)
                 logger.debug("edge.coalesce", f"Item coalesced, depth={len(self._q)}")
-            elif res == PutResult.BLOCKED:
+            elif res is PutResult.BLOCKED:
                 blocked_duration = time.perf_counter() - start_time
                 if self._blocked_time:
                     self._blocked_time.observe(blocked_duration)
@@ -120,6 +130,115 @@ class Edge(Generic[T]):
         self.depth()
         return item
 
+    def try_put_many(self, items: Iterable[T], policy: Policy[T] | None = None) -> int:
+        """
+        Enqueue items in order under a single policy and return how many were consumed.
+
+        Validation and the policy decision still run per item, but logging, metrics and
+        the depth gauge are updated once per call. Without a spec, the free capacity is
+        filled with one deque.extend() for the built-in policies, which all accept items
+        below capacity. Stops at the first BLOCKED result, so the return value is the
+        index a caller should resume from.
+        """
+        logger = get_logger()
+        q = self._q
+        spec = self.spec
+        capacity = self.capacity
+        pol = policy or self.default_policy or _DEFAULT_POLICY
+        consumed = 0
+        enqueued = 0
+        dropped = 0
+        blocked = False
+        start_time = time.perf_counter()
+        it = iter(items)
+        try:
+            if spec is None and type(pol) in _ACCEPT_BELOW_CAPACITY and len(q) < capacity:
+                before = len(q)
+                q.extend(islice(it, capacity - before))
+                consumed = enqueued = len(q) - before
+            for item in it:
+                value = item.payload if isinstance(item, Message) else item
+                if spec and not spec.validate(value):
+                    with with_context(edge_id=self._edge_id()):
+                        logger.warn(
+                            "edge.validation_failed", "Item does not conform to PortSpec schema"
+                        )
+                    raise TypeError("item does not conform to PortSpec schema")
+                res = pol.on_enqueue(capacity, len(q), item)
+                if res is PutResult.OK:
+                    q.append(item)
+                    enqueued += 1
+                elif res is PutResult.REPLACED:
+                    if q:
+                        q.pop()
+                    q.append(item)
+                    enqueued += 1
+                elif res is PutResult.DROPPED:
+                    dropped += 1
+                elif res is PutResult.COALESCED and isinstance(pol, Coalesce):
+                    self._coalesce(pol, item)
+                    enqueued += 1
+                elif res is PutResult.BLOCKED:
+                    blocked = True
+                    break
+                consumed += 1
+        finally:
+            if enqueued and self._enq:
+                self._enq.inc(enqueued)
+            if dropped and self._drops:
+                self._drops.inc(dropped)
+            if blocked and self._blocked_time:
+                self._blocked_time.observe(time.perf_counter() - start_time)
+            self.depth()
+        with with_context(edge_id=self._edge_id()):
+            logger.debug(
+                "edge.enqueue_many",
+                f"Batch enqueued {enqueued} of {consumed} items, depth={len(q)}",
+            )
+        return consumed
+
+    def try_get_many(self, n: int) -> list[T]:
+        logger = get_logger()
+        q = self._q
+        popleft = q.popleft
+        items = [popleft() for _ in range(min(n, len(q)))]
+        if items:
+            if self._deq:
+                self._deq.inc(len(items))
+            with with_context(edge_id=self._edge_id()):
+                logger.debug(
+                    "edge.dequeue_many", f"Batch dequeued {len(items)} items, depth={len(q)}"
+                )
+        self.depth()
+        return items
+
+    def drain_into(self, sink: list[T] | None = None) -> int:
+        """
+        Remove every queued item in one pass and return how many were removed.
+
+        Items are appended to sink in FIFO order when provided; otherwise discarded.
+        """
+        logger = get_logger()
+        q = self._q
+        count = len(q)
+        if count:
+            if sink is not None:
+                sink.extend(q)
+            q.clear()
+            if self._deq:
+                self._deq.inc(count)
+            with with_context(edge_id=self._edge_id()):
+                logger.debug("edge.drain", f"Drained {count} items")
+        self.depth()
+        return count
+
+    def clear(self) -> None:
+        """
+        Discard all queued items without recording them as dequeued.
+        """
+        self._q.clear()
+        self.depth()
+
     def is_empty(self) -> bool:
         return len(self._q) == 0
 
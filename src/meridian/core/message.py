@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
@@ -81,19 +82,22 @@ class Message:
           - This method mutates the frozen dataclass via object.__setattr__ only to
             finalize auto-populated headers at construction time.
         """
-        # Ensure trace_id is present in headers only when the key is absent.
-        # If the key is present with a value of None, preserve that explicit intent.
-        if "trace_id" not in self.headers:
+        # Ensure trace_id/timestamp are present only when the key is absent.
+        # If a key is present with a value of None, preserve that explicit intent
+        # so get_trace_id()/get_timestamp() can coerce it in tests.
+        # Both defaults are merged into a single copy so the caller's dict is never
+        # mutated and at most one dict is allocated per message.
+        headers = self.headers
+        needs_trace_id = "trace_id" not in headers
+        needs_timestamp = "timestamp" not in headers
+        if needs_trace_id or needs_timestamp:
+            merged = dict(headers)
+            if needs_trace_id:
+                merged["trace_id"] = generate_trace_id()
+            if needs_timestamp:
+                merged["timestamp"] = time.time()
             # We need to work around frozen dataclass limitation
-            object.__setattr__(self, "headers", {**self.headers, "trace_id": generate_trace_id()})
-
-        # Ensure timestamp is present only when the key is absent.
-        # If the key is present with a value of None, preserve that explicit intent
-        # so get_timestamp() can coerce it to 0.0 in tests.
-        if "timestamp" not in self.headers:
-            import time
-
-            object.__setattr__(self, "headers", {**self.headers, "timestamp": time.time()})
+            object.__setattr__(self, "headers", merged)
 
     def is_control(self) -> bool:
         """Return True if this message is a CONTROL message."""
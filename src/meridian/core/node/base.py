@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from ...observability.logging import get_logger, with_context
+from ...observability.logging import LogLevel, get_logger, with_context
 from ...observability.metrics import get_metrics, time_block
-from ...observability.tracing import get_trace_id, set_trace_id, start_span
+from ...observability.tracing import get_trace_id, is_tracing_enabled, set_trace_id, start_span
 from ..message import Message, MessageType
 from ..ports import Port, PortDirection, PortSpec
 
 if TYPE_CHECKING:
     from ..scheduler import Scheduler
 
+_EMITTABLE_TYPES = frozenset(MessageType)
+
 
 @dataclass(slots=True)
 class Node:
@@ -25,6 +27,10 @@ class Node:
     _messages_total: Any = None
     _errors_total: Any = None
     _tick_duration: Any = None
+    _output_ports: list[Port] = field(default_factory=list, init=False, repr=False, compare=False)
+    _output_names: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self._init_metrics()
@@ -54,7 +60,11 @@ class Node:
         trace_id = msg.get_trace_id()
         if trace_id:
             set_trace_id(trace_id)
-        with start_span("node.on_message", {"node": self.name, "port": port, "trace_id": trace_id}):
+        # The no-op tracer ignores span attributes, so only build them when tracing is on
+        attributes = None
+        if is_tracing_enabled():
+            attributes = {"node": self.name, "port": port, "trace_id": trace_id}
+        with start_span("node.on_message", attributes):
             with with_context(node=self.name, port=port, trace_id=trace_id):
                 try:
                     start_time = time.perf_counter()
@@ -62,11 +72,12 @@ class Node:
                     duration = time.perf_counter() - start_time
                     if self._messages_total:
                         self._messages_total.inc(1)
-                    logger.debug(
-                        "node.message_processed",
-                        f"Message processed in {duration:.6f}s",
-                        duration=duration,
-                    )
+                    if logger.is_enabled_for(LogLevel.DEBUG):
+                        logger.debug(
+                            "node.message_processed",
+                            f"Message processed in {duration:.6f}s",
+                            duration=duration,
+                        )
                 except Exception as e:
                     if self._errors_total:
                         self._errors_total.inc(1)
@@ -108,12 +119,42 @@ class Node:
         with with_context(node=self.name):
             logger.info("node.stop", f"Node {self.name} stopping")
 
+    def _output_port_names(self) -> frozenset[str]:
+        # Rebuilt only when `outputs` is reassigned or its ports change; the list
+        # comparison is a C-level identity check per port in the common case.
+        outputs = self.outputs
+        if outputs != self._output_ports:
+            self._output_ports = list(outputs)
+            self._output_names = frozenset(p.name for p in outputs)
+        return self._output_names
+
     def emit(self, port: str, msg: Message) -> Message:
-        logger = get_logger()
-        if msg.type not in (MessageType.DATA, MessageType.CONTROL, MessageType.ERROR):
+        if msg.type not in _EMITTABLE_TYPES:
             raise ValueError("invalid message type")
-        if port not in {p.name for p in self.outputs}:
+        if port not in self._output_port_names():
             raise KeyError(f"unknown output port: {port}")
+        return self._emit_checked(port, msg)
+
+    def _bind_emit(self, port: str) -> Callable[[Message], Message]:
+        """
+        Resolve an output port once and return an emitter for it.
+
+        The returned callable behaves like `emit(port, msg)` but skips the per-call
+        output port lookup. Bind after `outputs` is final (e.g. in `on_start`).
+        """
+        if port not in self._output_port_names():
+            raise KeyError(f"unknown output port: {port}")
+        emit_checked = self._emit_checked
+
+        def emit(msg: Message) -> Message:
+            if msg.type not in _EMITTABLE_TYPES:
+                raise ValueError("invalid message type")
+            return emit_checked(port, msg)
+
+        return emit
+
+    def _emit_checked(self, port: str, msg: Message) -> Message:
+        logger = get_logger()
         current_trace_id = get_trace_id()
         if current_trace_id and not msg.get_trace_id():
             msg = msg.with_headers(trace_id=current_trace_id)
@@ -83,6 +83,9 @@ class RoutingPolicy:
     key: str = "default"
 
     def select(self, item: Routable | object) -> str:
-        if isinstance(item, Routable):
-            return item.route_key()
+        # A single getattr() instead of isinstance() against the runtime-checkable Routable
+        # protocol, which re-inspects the object's attributes on every call.
+        route_key = getattr(item, "route_key", None)
+        if callable(route_key):
+            return route_key()  # type: ignore[no-any-return]
         return self.key
@@ -50,11 +50,13 @@ class RuntimePlan:
         self.nodes: dict[str, NodeRef] = {}
         self.edges: dict[str, EdgeRef] = {}
         self.ready_states: dict[str, ReadyState] = {}
+        self._outgoing: dict[tuple[str, str], list[Edge[Any]]] = {}
 
     def clear(self) -> None:
         self.nodes.clear()
         self.edges.clear()
         self.ready_states.clear()
+        self._outgoing.clear()
 
     def build_from_graphs(
         self,
@@ -86,6 +88,10 @@ class RuntimePlan:
                     self.nodes[edge.source_node].outputs[edge.source_port.name] = edge_ref
                 if edge.target_node in self.nodes:
                     self.nodes[edge.target_node].inputs[edge.target_port.name] = edge_ref
+        # Index from the deduplicated edge map so a repeated connection routes to one edge
+        for edge_ref in self.edges.values():
+            edge = edge_ref.edge
+            self._outgoing.setdefault((edge.source_node, edge.source_port.name), []).append(edge)
 
     def update_readiness(self, tick_interval_ms: int) -> None:
         current_time = monotonic()
@@ -130,8 +136,4 @@ class RuntimePlan:
             node_ref.node._set_scheduler(scheduler)
 
     def get_outgoing_edges(self, node_name: str, port_name: str) -> list[Any]:
-        edges = []
-        for edge_ref in self.edges.values():
-            if edge_ref.edge.source_node == node_name and edge_ref.edge.source_port.name == port_name:
-                edges.append(edge_ref.edge)
-        return edges
+        return list(self._outgoing.get((node_name, port_name), ()))
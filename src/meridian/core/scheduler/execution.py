@@ -62,7 +62,7 @@ def handle_node_emit(plan: RuntimePlan, metrics: Any, node: Node, port: str, msg
             edge_id=edge._edge_id(),
             message_type=msg.type.value,
         ):
-            if result == PutResult.BLOCKED:
+            if result is PutResult.BLOCKED:
                 logger.debug("scheduler.backpressure", "Message blocked, applying backpressure")
                 source_node_name = node.name
                 if source_node_name in plan.ready_states:
@@ -78,21 +78,21 @@ def handle_node_emit(plan: RuntimePlan, metrics: Any, node: Node, port: str, msg
                 raise RuntimeError(
                     f"Backpressure: Edge {edge._edge_id()} is full (capacity: {edge.capacity})"
                 )
-            elif result == PutResult.DROPPED:
+            elif result is PutResult.DROPPED:
                 logger.warn(
                     "scheduler.message_dropped",
                     "Message dropped due to capacity limits",
                     edge_capacity=edge.capacity,
                     edge_size=edge.depth(),
                 )
-            elif result == PutResult.REPLACED:
+            elif result is PutResult.REPLACED:
                 logger.debug(
                     "scheduler.message_replaced",
                     "Message replaced older message",
                     edge_capacity=edge.capacity,
                     edge_size=edge.depth(),
                 )
-            elif result == PutResult.COALESCED:
+            elif result is PutResult.COALESCED:
                 logger.debug(
                     "scheduler.message_coalesced",
                     "Message coalesced with existing message",
@@ -35,6 +35,10 @@ class Logger:
     def _should_log(self, level: LogLevel) -> bool:
         return self._level_order[level] >= self._level_order[self._config.level]
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Return True if records at `level` would be emitted; lets callers skip formatting."""
+        return self._should_log(level)
+
     def _build_record(self, level: LogLevel, event: str, message: str, **fields: Any) -> dict[str, Any]:
         record = {"ts": time.time(), "level": level.value, "event": event, "message": message}
         if (trace_id := _get_trace_id_ctx()) is not None:
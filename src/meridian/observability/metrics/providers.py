@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Mapping
 from dataclasses import dataclass
 
@@ -74,8 +75,10 @@ class PrometheusHistogram:
         self._name = name
         self._labels = labels or {}
         self._buckets = buckets or list(DEFAULT_LATENCY_BUCKETS)
-        self._bucket_counts: dict[float, int] = {bucket: 0 for bucket in self._buckets}
-        self._bucket_counts[float("inf")] = 0
+        # Sorted finite upper bounds; counts[i] holds observations in (bounds[i-1], bounds[i]]
+        # and the trailing slot holds the +Inf overflow.
+        self._bounds: tuple[float, ...] = tuple(sorted({float(b) for b in self._buckets}))
+        self._counts: list[int] = [0] * (len(self._bounds) + 1)
         self._sum = 0.0
         self._count = 0
 
@@ -83,10 +86,10 @@ class PrometheusHistogram:
         value = float(v)
         self._sum += value
         self._count += 1
-        for bucket in self._buckets:
-            if value <= bucket:
-                self._bucket_counts[bucket] += 1
-        self._bucket_counts[float("inf")] += 1
+        if value != value:  # NaN only lands in +Inf
+            self._counts[-1] += 1
+            return
+        self._counts[bisect_left(self._bounds, value)] += 1
 
     @property
     def sum(self) -> float:
@@ -96,9 +99,25 @@ class PrometheusHistogram:
     def count(self) -> int:
         return self._count
 
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """Sorted upper bounds, ending with +Inf."""
+        return (*self._bounds, float("inf"))
+
+    @property
+    def counts(self) -> list[int]:
+        """Non-cumulative per-bucket counts aligned with `bounds`."""
+        return self._counts.copy()
+
     @property
     def buckets(self) -> dict[float, int]:
-        return self._bucket_counts.copy()
+        """Cumulative counts keyed by upper bound (Prometheus `le` semantics)."""
+        result: dict[float, int] = {}
+        running = 0
+        for bound, n in zip(self.bounds, self._counts, strict=True):
+            running += n
+            result[bound] = running
+        return result
 
 
 class PrometheusMetrics:
@@ -144,6 +163,13 @@ class PrometheusMetrics:
     def get_all_histograms(self) -> dict[str, PrometheusHistogram]:
         return self._histograms.copy()
 
+    def get_histogram(
+        self, name: str, labels: Mapping[str, str] | None = None
+    ) -> PrometheusHistogram | None:
+        """Look up an existing histogram by unqualified name without copying the registry."""
+        full_name = f"{self._config.namespace}_{name}"
+        return self._histograms.get(self._metric_key(full_name, labels))
+
 
 # Global metrics instance
 _global_metrics: Metrics = NoopMetrics()
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+import os
 import uuid
 
+# Version/variant bits applied by uuid.uuid4(); see _uuid4_str()
+_UUID4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID4_SET = (4 << 76) | (0x8000 << 48)
+
+
+def _uuid4_str() -> str:
+    # Same layout and randomness source as str(uuid.uuid4()) without building a UUID object,
+    # whose pure-Python __init__/__str__ dominate the cost of the legacy dashed IDs.
+    n = int.from_bytes(os.urandom(16)) & _UUID4_CLEAR | _UUID4_SET
+    h = f"{n:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 def new_trace_id() -> str:
     """
@@ -43,7 +56,7 @@ def generate_trace_id() -> str:
     Returns:
         str: UUID4 string with dashes (legacy format).
     """
-    return str(uuid.uuid4())
+    return _uuid4_str()
 
 
 def generate_correlation_id() -> str:
@@ -53,7 +66,7 @@ def generate_correlation_id() -> str:
     Returns:
         str: UUID4 string with dashes (legacy format).
     """
-    return str(uuid.uuid4())
+    return _uuid4_str()
 
 
 def generate_span_id() -> str:
@@ -63,4 +76,4 @@ def generate_span_id() -> str:
     Returns:
         str: UUID4 string with dashes (legacy format).
     """
-    return str(uuid.uuid4())
+    return _uuid4_str()
@@ -52,3 +52,82 @@ def test_schema_validation() -> None:
         pass
     else:
         raise AssertionError("expected TypeError")
+
+
+def test_try_put_many_and_get_many() -> None:
+    e = mk_edge(4)
+    assert e.try_put_many(range(3), Latest()) == 3
+    assert e.depth() == 3
+    assert e.try_get_many(2) == [0, 1]
+    assert e.try_get_many(10) == [2]
+    assert e.try_get_many(1) == []
+
+
+def test_try_put_many_matches_scalar_policy_semantics() -> None:
+    e = mk_edge(2)
+    assert e.try_put_many([1, 2, 3, 4], Latest()) == 4
+    assert e.try_get_many(2) == [1, 4]
+    d = mk_edge(2)
+    assert d.try_put_many([1, 2, 3], Drop()) == 3
+    assert d.try_get_many(5) == [1, 2]
+    c = mk_edge(1)
+    assert c.try_put_many([1, 2, 3], Coalesce(lambda a, b: a + b)) == 3
+    assert c.try_get_many(1) == [6]
+
+
+def test_try_put_many_stops_at_block() -> None:
+    e = mk_edge(2)
+    assert e.try_put_many([1, 2, 3, 4], Block()) == 2
+    assert e.depth() == 2
+    assert e.try_put(3, Block()) == PutResult.BLOCKED
+
+
+def test_try_put_many_without_spec_fills_then_applies_policy() -> None:
+    p_out = Port("o", PortDirection.OUTPUT)
+    p_in = Port("i", PortDirection.INPUT)
+    e: Edge[int] = Edge("A", p_out, "B", p_in, capacity=3)
+    assert e.try_put(0) == PutResult.OK
+    assert e.try_put_many((i for i in range(1, 6)), Latest()) == 5
+    assert e.try_get_many(5) == [0, 1, 5]
+    assert e.try_put_many(iter([1, 2, 3, 4, 5]), Block()) == 3
+    assert e.try_get_many(5) == [1, 2, 3]
+    assert e.try_put_many([1, 2, 3, 4], Drop()) == 4
+    assert e.try_get_many(5) == [1, 2, 3]
+
+
+def test_try_put_many_validates_schema() -> None:
+    e = mk_edge(4)
+    try:
+        e.try_put_many([1, "x", 3], Latest())  # type: ignore[list-item]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError")
+    assert e.try_get_many(4) == [1]
+
+
+def test_drain_into() -> None:
+    e = mk_edge(4)
+    e.try_put_many(range(3), Latest())
+    sink: list[int] = []
+    assert e.drain_into(sink) == 3
+    assert sink == [0, 1, 2]
+    assert e.is_empty()
+    e.try_put_many(range(2), Latest())
+    assert e.drain_into() == 2
+    assert e.drain_into() == 0
+
+
+def test_clear_resets_edge() -> None:
+    e = mk_edge(2)
+    e.try_put_many([1, 2], Latest())
+    e.clear()
+    assert e.is_empty() and e.depth() == 0
+    assert e.try_put(3, Block()) == PutResult.OK
+    assert e.try_get() == 3
+
+
+def test_edge_is_slotted() -> None:
+    e = mk_edge()
+    assert not hasattr(e, "__dict__")
+    assert e._enq is not None and e._depth is not None
@@ -32,6 +32,15 @@ def test_headers_preserved_when_provided() -> None:
     assert m.headers["custom"] == "x"
 
 
+def test_headers_defaults_do_not_mutate_caller_dict() -> None:
+    headers: dict[str, Any] = {"custom": "x"}
+    m = Message(type=MessageType.DATA, payload=1, headers=headers)
+
+    assert headers == {"custom": "x"}
+    assert m.headers is not headers
+    assert set(m.headers) == {"custom", "trace_id", "timestamp"}
+
+
 def test_with_headers_merges_and_overrides() -> None:
     base = Message(type=MessageType.CONTROL, payload=None, headers={"h1": "v1", "h2": "v2"})
     derived = base.with_headers(h2="override", h3="new")
@@ -1,4 +1,4 @@
-from meridian.core import Message, MessageType, Node
+from meridian.core import Message, MessageType, Node, Port, PortDirection
 
 
 def test_node_with_ports_and_handle() -> None:
@@ -17,3 +17,32 @@ def test_node_emit_unknown_port() -> None:
         pass
     else:
         raise AssertionError()
+
+
+def test_node_bind_emit() -> None:
+    n = Node.with_ports("N", [], ["out"])
+    emit_out = n._bind_emit("out")
+    msg = Message(MessageType.DATA, 1)
+    assert emit_out(msg) is msg
+    try:
+        n._bind_emit("nope")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError()
+
+
+def test_node_emit_tracks_reassigned_outputs() -> None:
+    n = Node.with_ports("N", [], ["out"])
+    msg = Message(MessageType.DATA, 1)
+    assert n.emit("out", msg) is msg
+    n.outputs = [Port("other", PortDirection.OUTPUT)]
+    assert n.emit("other", msg) is msg
+    try:
+        n.emit("out", msg)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError()
+    n.outputs.append(Port("late", PortDirection.OUTPUT))
+    assert n.emit("late", msg) is msg
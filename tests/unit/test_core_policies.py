@@ -13,6 +13,42 @@ def test_routing_policy() -> None:
     assert rp.select(object()) == "default"
 
 
+class NotCallableKey:
+    route_key = "k"
+
+
+class SubDummy(Dummy):
+    def route_key(self) -> str:
+        return "sub"
+
+
+def test_routing_policy_resolves_per_type() -> None:
+    rp = RoutingPolicy(key="fallback")
+    assert rp.select(NotCallableKey()) == "fallback"
+    assert rp.select(SubDummy()) == "sub"
+    assert rp.select(Dummy()) == "k"
+    assert rp.select(1) == "fallback"
+
+
+def test_routing_policy_honours_instance_route_key() -> None:
+    class Plain:
+        pass
+
+    class Proxy:
+        def __getattr__(self, name: str) -> object:
+            if name == "route_key":
+                return lambda: "proxied"
+            raise AttributeError(name)
+
+    rp = RoutingPolicy()
+    item = Plain()
+    assert rp.select(item) == "default"
+    item.route_key = lambda: "inst"  # type: ignore[attr-defined]
+    assert rp.select(item) == "inst"
+    assert rp.select(Plain()) == "default"
+    assert rp.select(Proxy()) == "proxied"
+
+
 def test_put_policy_results() -> None:
     blk = Block()
     drp = Drop()
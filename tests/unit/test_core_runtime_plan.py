@@ -241,3 +241,15 @@ def test_priority_computation_uses_highest_ready_input_priority() -> None:
     assert rp.ready_states["C"].message_ready is True
     # Highest among ready inputs should be HIGH
     assert rp.get_node_priority("C") == PriorityBand.HIGH
+
+
+def test_get_outgoing_edges_deduplicates_repeated_connection() -> None:
+    g = _build_graph()
+    g.connect(("P", "o"), ("C", "i"), capacity=8)
+    rp = RuntimePlan()
+    rp.build_from_graphs([g])
+
+    outs = rp.get_outgoing_edges("P", "o")
+    assert len(outs) == 1
+    assert outs[0] is rp.edges["P:o->C:i"].edge
+    assert rp.nodes["C"].inputs["i"].edge is outs[0]
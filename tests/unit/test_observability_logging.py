@@ -55,6 +55,14 @@ class TestLogger:
         assert warn_record["level"] == "WARN"
         assert error_record["level"] == "ERROR"
 
+    def test_is_enabled_for(self) -> None:
+        """Test level check used to skip formatting of filtered records."""
+        logger = Logger(LogConfig(level=LogLevel.INFO, stream=StringIO()))
+
+        assert not logger.is_enabled_for(LogLevel.DEBUG)
+        assert logger.is_enabled_for(LogLevel.INFO)
+        assert logger.is_enabled_for(LogLevel.ERROR)
+
     def test_context_enrichment(self) -> None:
         """Test context variable enrichment."""
         stream = StringIO()
@@ -104,6 +104,28 @@ class TestPrometheusMetrics:
         assert buckets[5.0] == 3  # all values <= 5.0
         assert buckets[float("inf")] == 3  # all values
 
+    def test_prometheus_histogram_bounds_and_counts(self) -> None:
+        """Test per-bucket counts over sorted bounds, including edge values."""
+        config = PrometheusConfig(namespace="test", default_buckets=[1.0, 0.1, 0.5])
+        histogram = PrometheusMetrics(config).histogram("h")
+
+        for v in (0.1, 0.2, 0.5, 7.0, float("nan")):
+            histogram.observe(v)
+
+        assert histogram.bounds == (0.1, 0.5, 1.0, float("inf"))
+        assert histogram.counts == [1, 2, 0, 2]  # upper bounds are inclusive
+        assert list(histogram.buckets.values()) == [1, 3, 3, 5]
+
+    def test_get_histogram(self) -> None:
+        """Test direct histogram lookup by unqualified name and labels."""
+        metrics = PrometheusMetrics(PrometheusConfig(namespace="test"))
+        plain = metrics.histogram("latency")
+        labeled = metrics.histogram("latency", {"node": "a"})
+
+        assert metrics.get_histogram("latency") is plain
+        assert metrics.get_histogram("latency", {"node": "a"}) is labeled
+        assert metrics.get_histogram("missing") is None
+
     def test_metric_naming_with_namespace(self) -> None:
         """Test metric naming with namespace."""
         config = PrometheusConfig(namespace="meridian-runtime")
@@ -1,6 +1,7 @@
 """Unit tests for meridian.utils.ids module."""
 
 import re
+import uuid
 
 from meridian.utils.ids import (
     generate_correlation_id,
@@ -118,6 +119,15 @@ class TestLegacyAliases:
         assert len(span_id) == 36
         assert re.match(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", span_id)
 
+    def test_legacy_ids_are_valid_uuid4(self):
+        """Test that legacy dashed IDs carry the UUID4 version and variant bits."""
+        for legacy in (generate_trace_id, generate_correlation_id, generate_span_id):
+            value = legacy()
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == value
+
     def test_legacy_uniqueness(self):
         """Test that legacy functions generate unique IDs."""
         trace_ids = {generate_trace_id() for _ in range(20)}